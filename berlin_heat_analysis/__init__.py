@@ -0,0 +1,8 @@
+"""
+Berlin urban heat analysis
+Summer temperature, green coverage and tree plantation priority per area
+
+Stages are importable functions; heavy dependencies (osmnx, geopandas,
+folium, scipy, ee, matplotlib) are imported inside the functions that
+need them. Run the stages through the CLI: python -m berlin_heat_analysis
+"""
@@ -0,0 +1,195 @@
+"""
+Compact array-backed area table
+Geometries as packed GeoArrow-style coordinate buffers plus offsets, one per
+precomputed CRS, and attributes as NumPy columns
+
+A saved store is a directory of .npy files. AreaStore.open memory-maps them
+read-only, so worker processes share the same pages instead of unpickling
+GeoDataFrame copies.
+"""
+
+import json
+import os
+
+from .config import UTM_EPSG, WGS84_EPSG
+
+META_FILE = "meta.json"
+
+
+class AreaStore:
+    """Area polygons in WGS84 and UTM plus NumPy attribute columns.
+
+    geometry maps EPSG code → (shapely GeometryType, coords, offsets) as
+    returned by shapely.to_ragged_array; columns maps name → 1-D array.
+    """
+
+    def __init__(self, geometry, columns, path=None):
+        self.geometry = geometry
+        self.columns = columns
+        self.path = path
+
+    @classmethod
+    def from_gdf(cls, gdf, epsgs=(WGS84_EPSG, UTM_EPSG)):
+        """Pack a GeoDataFrame of (Multi)Polygons, projecting it once to every CRS in epsgs.
+
+        Text columns become fixed-width strings; missing values there raise
+        ValueError, since they would otherwise be stored as "nan"/"None".
+        """
+        import numpy as np
+        import pandas as pd
+        import shapely
+
+        geometry = {}
+        for epsg in epsgs:
+            geoms = np.asarray(gdf.geometry.to_crs(epsg=epsg).values)
+            geom_type, coords, offsets = shapely.to_ragged_array(geoms)
+            geometry[int(epsg)] = (geom_type, coords, offsets)
+
+        columns = {}
+        for name in gdf.columns:
+            if name == gdf.geometry.name:
+                continue
+            values = gdf[name].to_numpy()
+            # Fixed-width strings instead of Python objects, so columns can be memory-mapped
+            if values.dtype == object:
+                if pd.isna(values).any():
+                    raise ValueError(f"Column '{name}' has missing values; drop or fill them first")
+                values = values.astype(str)
+            columns[name] = values
+
+        return cls(geometry, columns)
+
+    @classmethod
+    def open(cls, path, mmap=True):
+        """Open a saved store; with mmap, arrays are read-only memory maps."""
+        import numpy as np
+
+        mmap_mode = "r" if mmap else None
+
+        def load(name):
+            return np.load(os.path.join(path, name), mmap_mode=mmap_mode, allow_pickle=False)
+
+        with open(os.path.join(path, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        geometry = {}
+        for epsg, info in meta["geometry"].items():
+            coords = load(f"geom_{epsg}_coords.npy")
+            offsets = tuple(load(f"geom_{epsg}_offsets_{k}.npy") for k in range(info["n_offsets"]))
+            geometry[int(epsg)] = (info["type"], coords, offsets)
+
+        columns = {name: load(f"col_{i}.npy") for i, name in enumerate(meta["columns"])}
+        return cls(geometry, columns, path=path)
+
+    def save(self, path):
+        """Write the store to a directory of .npy files and remember the path.
+
+        Files are written to a temporary sibling directory that then replaces
+        path, so an interrupted save never leaves old and new files mixed.
+        """
+        import shutil
+        import tempfile
+
+        import numpy as np
+
+        path = os.path.abspath(path)
+        parent, name = os.path.split(path)
+        os.makedirs(parent, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=f".{name}.", dir=parent)
+
+        try:
+            meta = {"geometry": {}, "columns": list(self.columns)}
+
+            for epsg, (geom_type, coords, offsets) in self.geometry.items():
+                np.save(os.path.join(tmp, f"geom_{epsg}_coords.npy"), coords)
+                for k, offset in enumerate(offsets):
+                    np.save(os.path.join(tmp, f"geom_{epsg}_offsets_{k}.npy"), offset)
+                meta["geometry"][str(epsg)] = {"type": int(geom_type), "n_offsets": len(offsets)}
+
+            for i, values in enumerate(self.columns.values()):
+                np.save(os.path.join(tmp, f"col_{i}.npy"), values)
+
+            with open(os.path.join(tmp, META_FILE), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+        # A directory cannot replace a non-empty one, so move the old store aside first
+        old = None
+        if os.path.exists(path):
+            old = tempfile.mkdtemp(prefix=f".{name}.old.", dir=parent)
+            os.replace(path, old)
+        os.replace(tmp, path)
+        if old is not None:
+            shutil.rmtree(old, ignore_errors=True)
+
+        self.path = path
+        return self
+
+    # ---------------- Access ----------------
+
+    @property
+    def epsgs(self):
+        return list(self.geometry)
+
+    def __len__(self):
+        _, _, offsets = next(iter(self.geometry.values()))
+        return len(offsets[-1]) - 1
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __setitem__(self, name, values):
+        import numpy as np
+
+        values = np.asarray(values)
+        if values.shape != (len(self),):
+            raise ValueError(f"Column '{name}' must have length {len(self)}, got shape {values.shape}")
+        self.columns[name] = values
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def geometries(self, epsg, start=0, stop=None):
+        """Return geometries [start:stop] in the given CRS as a NumPy array of shapely objects.
+
+        The slice is taken on the packed buffers, so only those geometries are built.
+        """
+        import shapely
+
+        geom_type, coords, offsets = self.geometry[epsg]
+        if stop is None:
+            stop = len(self)
+
+        # Walk the offsets from geometries inwards to rings, rebasing each slice to 0
+        lo, hi = start, stop
+        sliced = []
+        for offset in reversed(offsets):
+            part = offset[lo:hi + 1]
+            sliced.append(part - part[0])
+            lo, hi = int(part[0]), int(part[-1])
+
+        return shapely.from_ragged_array(
+            shapely.GeometryType(geom_type), coords[lo:hi], tuple(reversed(sliced))
+        )
+
+    def total_bounds(self, epsg):
+        """Return (minx, miny, maxx, maxy) of all areas, straight from the coordinate buffer."""
+        _, coords, _ = self.geometry[epsg]
+        return (*coords.min(axis=0), *coords.max(axis=0))
+
+    def to_frame(self, columns=None):
+        """Return the attribute columns as a pandas DataFrame."""
+        import pandas as pd
+
+        names = list(self.columns) if columns is None else columns
+        return pd.DataFrame({name: self.columns[name] for name in names})
+
+    def to_gdf(self, epsg=WGS84_EPSG, columns=None):
+        """Return a GeoDataFrame in the given (precomputed) CRS."""
+        import geopandas as gpd
+
+        return gpd.GeoDataFrame(
+            self.to_frame(columns), geometry=self.geometries(epsg), crs=f"EPSG:{epsg}"
+        )
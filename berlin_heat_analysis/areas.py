@@ -0,0 +1,151 @@
+"""
+Berlin administrative areas and OSM green areas
+Shared loaders and the green coverage calculation used by every map stage
+"""
+
+import os
+
+from .area_store import META_FILE, AreaStore
+from .config import AREA_STORE_DIR, GREEN_SOURCES, PLACE, UTM_EPSG
+
+AREA_TAGS = {"boundary": "administrative", "admin_level": "10"}
+GREEN_TAGS = {
+    "leisure": ["park", "garden"],
+    "landuse": ["forest", "grass", "meadow"]
+}
+POLYGON_TYPES = ["Polygon", "MultiPolygon"]
+
+
+def load_areas(inside_berlin=True):
+    """Load Berlin administrative areas as a GeoDataFrame with 'area' and 'geometry'.
+
+    With inside_berlin, areas that are not fully inside the Berlin boundary
+    (and the Berlin polygon itself) are dropped.
+    """
+    import osmnx as ox
+
+    print("📥 Loading Berlin administrative areas...")
+    gdf_areas = ox.features_from_place(PLACE, tags=AREA_TAGS)
+    # Unnamed areas cannot be matched to temperatures or labelled on the maps
+    gdf_areas = gdf_areas[["name", "geometry"]].dropna(subset=["name", "geometry"]).reset_index(drop=True)
+    gdf_areas = gdf_areas.rename(columns={"name": "area"})
+
+    if inside_berlin:
+        berlin_boundary = ox.geocode_to_gdf(PLACE).geometry.iloc[0]
+        gdf_areas = gdf_areas[gdf_areas.geometry.intersects(berlin_boundary)]
+        gdf_areas = gdf_areas[gdf_areas.geometry.within(berlin_boundary.buffer(0.0001))]
+        gdf_areas = gdf_areas[gdf_areas["area"] != "Berlin"]
+        print(f"✅ Kept {len(gdf_areas)} areas fully inside Berlin")
+    else:
+        print(f"✅ Loaded {len(gdf_areas)} Areas")
+
+    return gdf_areas
+
+
+def load_area_store(path=AREA_STORE_DIR, refresh=False):
+    """Open the packed areas inside Berlin, downloading and saving them on first use."""
+    # AreaStore.save swaps in complete directories, so meta.json marks a full cache
+    if not refresh and os.path.exists(os.path.join(path, META_FILE)):
+        store = AreaStore.open(path)
+        print(f"✅ Opened {len(store)} areas from '{path}'")
+        return store
+
+    gdf_areas = load_areas()
+    gdf_areas = gdf_areas[gdf_areas.geom_type.isin(POLYGON_TYPES)].reset_index(drop=True)
+    return AreaStore.from_gdf(gdf_areas).save(path)
+
+
+def load_green_areas():
+    """Load OSM parks, gardens, forests, grass and meadows as a geometry-only GeoDataFrame.
+
+    Only (Multi)Polygons are kept; tagged nodes and ways have no area.
+    """
+    import osmnx as ox
+
+    print("🌿 Fetching green areas from OSM...")
+    gdf_green = ox.features_from_place(PLACE, GREEN_TAGS)
+    gdf_green = gdf_green[["geometry"]].dropna(subset=["geometry"])
+    return gdf_green[gdf_green.geom_type.isin(POLYGON_TYPES)].reset_index(drop=True)
+
+
+def _green_fractions(areas, green):
+    """Share of each area geometry covered by the green geometries (both in UTM)."""
+    import numpy as np
+    import shapely
+
+    tree = shapely.STRtree(green)
+    coverage = np.zeros(len(areas))
+    for i, geom in enumerate(areas):
+        intersected = tree.query(geom, predicate="intersects")
+        if len(intersected):
+            green_total = shapely.area(shapely.intersection(green[intersected], geom)).sum()
+            coverage[i] = green_total / geom.area
+    return coverage
+
+
+def _green_fractions_chunk(area_path, green_path, start, stop):
+    # Worker: both stores are memory-mapped, nothing but offsets is pickled
+    areas = AreaStore.open(area_path).geometries(UTM_EPSG, start, stop)
+    green = AreaStore.open(green_path).geometries(UTM_EPSG)
+    return _green_fractions(areas, green)
+
+
+def compute_green_coverage(store, green_store, processes=1):
+    """Set store['green_area']: the share (0–1) of each area covered by green.
+
+    With processes > 1 both stores must be saved; workers open them memory-mapped.
+    """
+    import numpy as np
+
+    print("📐 Calculating green coverage...")
+    if processes > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        if store.path is None or green_store.path is None:
+            raise ValueError("Parallel green coverage needs saved area and green stores")
+
+        bounds = np.linspace(0, len(store), processes + 1).astype(int)
+        with ProcessPoolExecutor(processes) as pool:
+            parts = pool.map(
+                _green_fractions_chunk,
+                [store.path] * processes,
+                [green_store.path] * processes,
+                bounds[:-1],
+                bounds[1:],
+            )
+            coverage = np.concatenate(list(parts))
+    else:
+        coverage = _green_fractions(store.geometries(UTM_EPSG), green_store.geometries(UTM_EPSG))
+
+    store["green_area"] = coverage
+    print("🌱 Green coverage calculation complete")
+    return store
+
+
+def add_green_coverage(store, source="osm", ndvi_path=None, processes=1):
+    """Set store['green_area'] from OSM green polygons or a local NDVI raster."""
+    if source not in GREEN_SOURCES:
+        raise ValueError(f"Unknown green coverage source: {source!r} (expected one of {GREEN_SOURCES})")
+
+    if source == "ndvi":
+        if ndvi_path is None:
+            raise ValueError("NDVI green coverage needs the path of an NDVI GeoTIFF")
+        from .ndvi_coverage import compute_ndvi_coverage
+        return compute_ndvi_coverage(store, ndvi_path)
+
+    gdf_green = load_green_areas()
+    if gdf_green.empty:
+        import numpy as np
+
+        print("⚠️ No green areas found in OSM; green coverage is 0 for every area")
+        store["green_area"] = np.zeros(len(store))
+        return store
+
+    green_store = AreaStore.from_gdf(gdf_green, epsgs=(UTM_EPSG,))
+    if processes <= 1:
+        return compute_green_coverage(store, green_store)
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        return compute_green_coverage(store, green_store.save(tmp), processes=processes)
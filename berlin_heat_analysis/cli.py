@@ -0,0 +1,186 @@
+"""
+Command line interface
+berlin-heat coverage | temps | priority | maps | stats | charts
+
+Usage: python -m berlin_heat_analysis <command> [options]
+Each command imports its stage module only when it runs; the stage modules
+import osmnx, geopandas, folium, scipy, ee and matplotlib inside their
+functions, so e.g. `stats` on cached CSVs never loads the GIS stack.
+"""
+
+import argparse
+import importlib
+import sys
+import time
+
+from . import config
+
+# Budget for importing the CLI plus one stage module (heavy deps excluded)
+IMPORT_BUDGET_S = 0.05
+# Budgets for a whole command run, heavy imports included (stats on cached CSVs).
+# tests/test_cli.py checks them against the wall-clock time of `python -m`,
+# interpreter startup included; --timings can only see the run itself.
+RUN_BUDGET_S = {"stats": 1.0}
+
+# Must never be imported just by importing the CLI or a stage module
+HEAVY_MODULES = ["osmnx", "geopandas", "folium", "ee", "matplotlib", "scipy", "rasterio"]
+
+
+def _load_stage(name, args):
+    """Import a stage module, checking its first import against IMPORT_BUDGET_S with --timings."""
+    module_name = f"{__package__}.{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    elapsed = time.perf_counter() - start
+
+    if args.timings:
+        over = elapsed > IMPORT_BUDGET_S
+        status = "⚠️ over budget" if over else "✅"
+        print(f"⏱️ import {name}: {elapsed * 1000:.1f} ms "
+              f"(budget {IMPORT_BUDGET_S * 1000:.0f} ms) {status}")
+        args.over_budget = args.over_budget or over
+    return module
+
+
+# ---------------- Commands ----------------
+
+def _cmd_coverage(args):
+    _load_stage("green_coverage", args).run(
+        args.output_csv, args.output_map, source=args.source, ndvi_path=args.ndvi,
+        processes=args.processes, refresh_areas=args.refresh_areas
+    )
+
+
+def _cmd_temps(args):
+    _load_stage("berlin_heatmap", args).run(
+        args.output_csv, args.output_by_area_csv, years=args.years, project=args.project
+    )
+
+
+def _cmd_priority(args):
+    _load_stage("berlin_tree_priority_map", args).run(
+        args.temp_csv, args.output_map, args.output_csv, source=args.source, ndvi_path=args.ndvi,
+        processes=args.processes, refresh_areas=args.refresh_areas
+    )
+
+
+def _cmd_maps(args):
+    temperature_map = _load_stage("berlin_temperature_map", args)
+    yearly_map = _load_stage("yearly_map_generator", args)
+
+    # Areas are loaded once and shared by all maps
+    gdf = _load_stage("areas", args).load_area_store(refresh=args.refresh_areas).to_gdf()
+    temperature_map.run(args.temp_csv, gdf=gdf)
+    for year in args.years:
+        yearly_map.run(year, args.yearly_csv, gdf=gdf)
+
+
+def _cmd_stats(args):
+    _load_stage("statistics", args).run(args.temp_csv, args.green_csv)
+
+
+def _cmd_charts(args):
+    _load_stage("charts", args).run(
+        args.temp_csv, args.green_csv, output_dir=args.output_dir, show=not args.no_show
+    )
+
+
+def _add_green_source_args(parser):
+    parser.add_argument("--source", choices=config.GREEN_SOURCES, default="osm",
+                        help="green coverage from OSM polygons or a local NDVI raster")
+    parser.add_argument("--ndvi", metavar="GEOTIFF", help="NDVI GeoTIFF for --source ndvi")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="worker processes for --source osm (share the area store via mmap)")
+
+
+def _add_area_args(parser):
+    parser.add_argument("--refresh-areas", action="store_true",
+                        help=f"re-download the Berlin areas into '{config.AREA_STORE_DIR}'")
+
+
+def _check_green_source(parser, args):
+    if getattr(args, "source", None) == "ndvi" and not args.ndvi:
+        parser.error("--source ndvi requires --ndvi GEOTIFF")
+    if getattr(args, "source", None) == "ndvi" and args.processes > 1:
+        parser.error("--processes only applies to --source osm")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="berlin-heat",
+        description="Berlin urban heat analysis: temperature, green coverage and tree priority",
+    )
+    parser.add_argument("--timings", action="store_true",
+                        help="check stage import and run time against their budgets; exit 1 when exceeded")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("coverage", help="green coverage per area (CSV + map)")
+    p.add_argument("--output-csv", default=config.GREEN_COVERAGE_CSV)
+    p.add_argument("--output-map", default=config.GREEN_COVERAGE_MAP)
+    _add_green_source_args(p)
+    _add_area_args(p)
+    p.set_defaults(func=_cmd_coverage)
+
+    p = sub.add_parser("temps", help="mean summer temperature per area from MODIS (CSV)")
+    p.add_argument("--output-csv", default=config.TEMP_YEARLY_CSV)
+    p.add_argument("--output-by-area-csv", default=config.TEMP_BY_AREA_CSV)
+    p.add_argument("--years", type=int, nargs="+", default=config.YEARS)
+    p.add_argument("--project", default=config.GEE_PROJECT, help="Earth Engine project")
+    p.set_defaults(func=_cmd_temps)
+
+    p = sub.add_parser("priority", help="tree plantation priority (TPPI) per area (CSV + map)")
+    p.add_argument("--temp-csv", default=config.TEMP_BY_AREA_CSV)
+    p.add_argument("--output-csv", default=config.PRIORITY_CSV)
+    p.add_argument("--output-map", default=config.PRIORITY_MAP)
+    _add_green_source_args(p)
+    _add_area_args(p)
+    p.set_defaults(func=_cmd_priority)
+
+    p = sub.add_parser("maps", help="average and yearly summer temperature maps")
+    p.add_argument("--temp-csv", default=config.TEMP_BY_AREA_CSV)
+    p.add_argument("--yearly-csv", default=config.TEMP_YEARLY_CSV)
+    p.add_argument("--years", type=int, nargs="+", default=config.YEARS)
+    _add_area_args(p)
+    p.set_defaults(func=_cmd_maps)
+
+    p = sub.add_parser("stats", help="T-test and Spearman correlation on cached CSVs")
+    p.add_argument("--temp-csv", default=config.TEMP_BY_AREA_CSV)
+    p.add_argument("--green-csv", default=config.GREEN_COVERAGE_CSV)
+    p.set_defaults(func=_cmd_stats)
+
+    p = sub.add_parser("charts", help="box plot, scatter plot and histogram (PNG)")
+    p.add_argument("--temp-csv", default=config.TEMP_BY_AREA_CSV)
+    p.add_argument("--green-csv", default=config.GREEN_COVERAGE_CSV)
+    p.add_argument("--output-dir", default=".")
+    p.add_argument("--no-show", action="store_true", help="save charts without opening windows")
+    p.set_defaults(func=_cmd_charts)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    _check_green_source(parser, args)
+
+    args.over_budget = False
+
+    start = time.perf_counter()
+    args.func(args)
+
+    if args.timings:
+        elapsed = time.perf_counter() - start
+        budget = RUN_BUDGET_S.get(args.command)
+        if budget is None:
+            print(f"⏱️ {args.command}: {elapsed:.2f} s total")
+        else:
+            over = elapsed > budget
+            status = "⚠️ over budget" if over else "✅"
+            print(f"⏱️ {args.command}: {elapsed:.2f} s total (budget {budget:.2f} s) {status}")
+            args.over_budget = args.over_budget or over
+        if args.over_budget:
+            return 1
+    return 0
@@ -0,0 +1,40 @@
+"""
+Shared settings
+Default input/output paths (relative to the project root) and study parameters
+"""
+
+PLACE = "Berlin, Germany"
+
+# Map CRS and metric CRS for area calculations (UTM zone 33N)
+WGS84_EPSG = 4326
+UTM_EPSG = 32633
+
+GEE_PROJECT = "testing-project-352109"
+
+# Summer months of every study year
+YEARS = list(range(2020, 2025))
+SUMMER_MONTHS = [6, 7, 8]
+
+# ---------------- Green coverage ----------------
+# "osm": tagged parks/forests/grass, "ndvi": local NDVI GeoTIFF
+GREEN_SOURCES = ["osm", "ndvi"]
+# Pixels with NDVI at or above this count as vegetation
+NDVI_THRESHOLD = 0.3
+
+# ---------------- Cached data ----------------
+# Packed Berlin areas (see area_store.py), reused by every map stage
+AREA_STORE_DIR = "cache/berlin_areas_store"
+
+# ---------------- CSV outputs ----------------
+CSV_DIR = "CSV"
+TEMP_YEARLY_CSV = f"{CSV_DIR}/berlin_mean_temperature_2020_2024.csv"
+TEMP_BY_AREA_CSV = f"{CSV_DIR}/berlin_mean_temperature_by_area.csv"
+GREEN_COVERAGE_CSV = f"{CSV_DIR}/berlin_green_coverage.csv"
+PRIORITY_CSV = f"{CSV_DIR}/berlin_tree_priority_scores.csv"
+
+# ---------------- Map outputs ----------------
+MAP_DIR = "map"
+TEMP_MAP = f"{MAP_DIR}/berlin_avg_summer_temp_map.html"
+YEARLY_TEMP_MAP = MAP_DIR + "/berlin_avg_summer_temp_map_{year}.html"
+GREEN_COVERAGE_MAP = f"{MAP_DIR}/berlin_green_coverage_map.html"
+PRIORITY_MAP = f"{MAP_DIR}/berlin_tree_priority_map.html"
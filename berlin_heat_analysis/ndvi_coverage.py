@@ -0,0 +1,102 @@
+"""
+Green coverage from a local NDVI raster
+Per-area vegetation fraction and mean NDVI from a Sentinel-2/Landsat NDVI GeoTIFF
+
+All areas are rasterized to a label grid and reduced with np.bincount,
+reading the raster in row strips over the areas' bounding window only.
+"""
+
+import math
+
+from .config import NDVI_THRESHOLD
+
+# Rows read (and rasterized) per strip; bounds memory for large rasters
+STRIP_ROWS = 1024
+
+
+def compute_ndvi_coverage(store, raster_path, threshold=NDVI_THRESHOLD, strip_rows=STRIP_ROWS):
+    """Set store['green_area'] and store['mean_ndvi'] from an NDVI raster.
+
+    'green_area' is the share (0–1) of valid pixels with NDVI >= threshold,
+    'mean_ndvi' the mean NDVI of valid pixels. Areas without valid pixels
+    (outside the raster, nodata, smaller than a pixel) get NaN for both, so
+    they count as missing rather than 0% green. Band scale/offset and nodata
+    are applied. Raises ValueError if the raster has no CRS or does not
+    overlap the areas.
+    """
+    import numpy as np
+    import rasterio
+    from rasterio.features import rasterize
+    from rasterio.windows import Window, from_bounds
+
+    print(f"🛰️ Calculating green coverage from NDVI raster '{raster_path}'...")
+    n = len(store)
+    pixel_count = np.zeros(n + 1, dtype=np.int64)
+    green_count = np.zeros(n + 1, dtype=np.int64)
+    ndvi_sum = np.zeros(n + 1, dtype=np.float64)
+
+    with rasterio.open(raster_path) as src:
+        if src.crs is None:
+            raise ValueError(f"NDVI raster '{raster_path}' has no CRS")
+
+        # Use the precomputed projection when the raster shares it (e.g. Sentinel-2 UTM 33N)
+        epsg = src.crs.to_epsg()
+        if epsg in store.epsgs:
+            geoms = store.geometries(epsg)
+            total_bounds = store.total_bounds(epsg)
+        else:
+            areas = store.to_gdf().to_crs(src.crs)
+            geoms = areas.geometry.values
+            total_bounds = areas.total_bounds
+
+        # Label 0 is background; area i gets label i + 1
+        shapes = [(geom, i + 1) for i, geom in enumerate(geoms) if not geom.is_empty]
+        scale = src.scales[0]
+        offset = src.offsets[0]
+
+        # Only read the pixels covering the areas
+        bounds = from_bounds(*total_bounds, transform=src.transform)
+        col0 = max(math.floor(bounds.col_off), 0)
+        row0 = max(math.floor(bounds.row_off), 0)
+        col1 = min(math.ceil(bounds.col_off + bounds.width), src.width)
+        row1 = min(math.ceil(bounds.row_off + bounds.height), src.height)
+        if col1 <= col0 or row1 <= row0:
+            raise ValueError(f"NDVI raster '{raster_path}' does not cover the areas")
+
+        for row in range(row0, row1, strip_rows):
+            window = Window(col0, row, col1 - col0, min(strip_rows, row1 - row))
+            labels = rasterize(
+                shapes,
+                out_shape=(int(window.height), int(window.width)),
+                transform=src.window_transform(window),
+                fill=0,
+                dtype="int32",
+            )
+            if not labels.any():
+                continue
+
+            ndvi = src.read(1, window=window, masked=True).astype(np.float64).filled(np.nan)
+            ndvi = ndvi * scale + offset
+
+            valid = (labels > 0) & np.isfinite(ndvi)
+            strip_labels = labels[valid]
+            strip_ndvi = ndvi[valid]
+
+            pixel_count += np.bincount(strip_labels, minlength=n + 1)
+            green_count += np.bincount(strip_labels[strip_ndvi >= threshold], minlength=n + 1)
+            ndvi_sum += np.bincount(strip_labels, weights=strip_ndvi, minlength=n + 1)
+
+    counts = pixel_count[1:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        green_fraction = np.where(counts > 0, green_count[1:] / counts, np.nan)
+        mean_ndvi = np.where(counts > 0, ndvi_sum[1:] / counts, np.nan)
+
+    missing = counts == 0
+    if missing.any():
+        names = ", ".join(store["area"][missing]) if "area" in store else f"{int(missing.sum())} areas"
+        print(f"⚠️ No valid NDVI pixels (green coverage left missing): {names}")
+
+    store["green_area"] = green_fraction
+    store["mean_ndvi"] = mean_ndvi
+    print(f"🌱 NDVI coverage complete ({int((counts > 0).sum())}/{n} areas with data)")
+    return store
@@ -1,82 +1,139 @@
-import pandas as pd
-from scipy.stats import ttest_ind, spearmanr
-
-# -------------------------
-# Load datasets
-# -------------------------
-temp_path = "H:/BHT/urban technology/urban_project/CSV/berlin_mean_temperature_by_area.csv"
-green_path = "H:/BHT/urban technology/urban_project/CSV/berlin_green_coverage.csv"
-
-df_temp = pd.read_csv(temp_path)
-df_green = pd.read_csv(green_path)
-
-# -------------------------
-# Check expected columns exist
-# -------------------------
-required_temp_cols = {"area", "mean_temp_c"}
-required_green_cols = {"area", "green_area"}
-
-if not required_temp_cols.issubset(df_temp.columns):
-    raise ValueError("Temperature CSV must contain: 'area', 'mean_temp_c'")
-
-if not required_green_cols.issubset(df_green.columns):
-    raise ValueError("Green coverage CSV must contain: 'area', 'green_area'")
-
-# -------------------------
-# Merge datasets
-# -------------------------
-df = pd.merge(df_temp, df_green, on="area", how="inner")
-
-print("Merged dataset preview:")
-print(df.head())
-
-# -------------------------
-# 1. T-test for temperature differences
-#    (Low green vs high green)
-# -------------------------
-median_green = df["green_area"].median()
-
-low_green = df[df["green_area"] < median_green]["mean_temp_c"]
-high_green = df[df["green_area"] >= median_green]["mean_temp_c"]
-
-t_stat, p_val_t = ttest_ind(low_green, high_green, equal_var=False)
-
-# -------------------------
-# 2. Spearman correlation
-# -------------------------
-rho, p_val_corr = spearmanr(df["green_area"], df["mean_temp_c"])
-
-# -------------------------
-# Print results
-# -------------------------
-print("\n--------------------------------------")
-print("          STATISTICAL RESULTS         ")
-print("--------------------------------------\n")
-
-print("T-TEST (Temperature: Low vs High Green Areas)")
-print(f"t-statistic = {t_stat:.3f}")
-print(f"p-value     = {p_val_t:.6f}")
-
-print("\nSpearman CORRELATION (Green Coverage vs Temperature)")
-print(f"rho         = {rho:.3f}")
-print(f"p-value     = {p_val_corr:.6f}")
-
-# -------------------------
-# Interpretation for slide
-# -------------------------
-print("\n--------------------------------------")
-print("           INTERPRETATION             ")
-print("--------------------------------------\n")
-
-if p_val_t < 0.05:
-    print("✔ Low-green areas are significantly hotter than high-green areas.")
-else:
-    print("✖ Temperature difference between low and high green areas is NOT statistically significant.")
-
-if p_val_corr < 0.05:
-    trend = "negative" if rho < 0 else "positive"
-    print(f"✔ Significant {trend} correlation: green coverage relates to temperature.")
-else:
-    print("✖ No statistically significant correlation between green coverage and temperature.")
-
-print("\n--------------------------------------")
+"""
+Statistical tests: green coverage vs summer temperature
+Welch T-test (low vs high green areas) and Spearman correlation
+"""
+
+from .config import GREEN_COVERAGE_CSV, TEMP_BY_AREA_CSV
+
+REQUIRED_TEMP_COLS = {"area", "mean_temp_c"}
+REQUIRED_GREEN_COLS = {"area", "green_area"}
+
+
+def load_merged(temp_path=TEMP_BY_AREA_CSV, green_path=GREEN_COVERAGE_CSV):
+    """Load temperature and green coverage CSVs and merge them on 'area'."""
+    import pandas as pd
+
+    df_temp = pd.read_csv(temp_path)
+    df_green = pd.read_csv(green_path)
+
+    # -------------------------
+    # Check expected columns exist
+    # -------------------------
+    if not REQUIRED_TEMP_COLS.issubset(df_temp.columns):
+        raise ValueError("Temperature CSV must contain: 'area', 'mean_temp_c'")
+
+    if not REQUIRED_GREEN_COLS.issubset(df_green.columns):
+        raise ValueError("Green coverage CSV must contain: 'area', 'green_area'")
+
+    # Areas without green data (e.g. no valid NDVI pixels) are missing, not 0% green
+    df_green = df_green.dropna(subset=["green_area"])
+
+    return pd.merge(df_temp, df_green, on="area", how="inner")
+
+
+def _welch_ttest(a, b):
+    """Welch's two-sided T-test; same result as scipy.stats.ttest_ind(a, b, equal_var=False)."""
+    import numpy as np
+    from scipy.special import stdtr
+
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    va = a.var(ddof=1) / len(a)
+    vb = b.var(ddof=1) / len(b)
+
+    t_stat = (a.mean() - b.mean()) / np.sqrt(va + vb)
+    df = (va + vb) ** 2 / (va ** 2 / (len(a) - 1) + vb ** 2 / (len(b) - 1))
+    return t_stat, 2 * stdtr(df, -abs(t_stat))
+
+
+def _spearman(x, y):
+    """Spearman rank correlation with the t-distribution p-value used by scipy.stats.spearmanr."""
+    import numpy as np
+    import pandas as pd
+    from scipy.special import stdtr
+
+    # Average ranks for ties, as scipy does
+    rank_x = pd.Series(x).rank().to_numpy()
+    rank_y = pd.Series(y).rank().to_numpy()
+    rho = np.corrcoef(rank_x, rank_y)[0, 1]
+
+    n = len(rank_x)
+    with np.errstate(divide="ignore"):
+        t = rho * np.sqrt((n - 2) / ((1.0 - rho) * (1.0 + rho)))
+    return rho, 2 * stdtr(n - 2, -abs(t))
+
+
+def compute_statistics(df):
+    """Return t_stat, p_val_t, rho and p_val_corr for a merged DataFrame.
+
+    Uses scipy.special instead of scipy.stats, whose import alone takes about a second.
+    """
+    # -------------------------
+    # 1. T-test for temperature differences
+    #    (Low green vs high green)
+    # -------------------------
+    median_green = df["green_area"].median()
+
+    low_green = df[df["green_area"] < median_green]["mean_temp_c"]
+    high_green = df[df["green_area"] >= median_green]["mean_temp_c"]
+
+    t_stat, p_val_t = _welch_ttest(low_green, high_green)
+
+    # -------------------------
+    # 2. Spearman correlation
+    # -------------------------
+    rho, p_val_corr = _spearman(df["green_area"], df["mean_temp_c"])
+
+    return {"t_stat": t_stat, "p_val_t": p_val_t, "rho": rho, "p_val_corr": p_val_corr}
+
+
+def run(temp_path=TEMP_BY_AREA_CSV, green_path=GREEN_COVERAGE_CSV):
+    """Print the statistical results and their interpretation."""
+    df = load_merged(temp_path, green_path)
+
+    print("Merged dataset preview:")
+    print(df.head())
+
+    results = compute_statistics(df)
+    t_stat, p_val_t = results["t_stat"], results["p_val_t"]
+    rho, p_val_corr = results["rho"], results["p_val_corr"]
+
+    # -------------------------
+    # Print results
+    # -------------------------
+    print("\n--------------------------------------")
+    print("          STATISTICAL RESULTS         ")
+    print("--------------------------------------\n")
+
+    print("T-TEST (Temperature: Low vs High Green Areas)")
+    print(f"t-statistic = {t_stat:.3f}")
+    print(f"p-value     = {p_val_t:.6f}")
+
+    print("\nSpearman CORRELATION (Green Coverage vs Temperature)")
+    print(f"rho         = {rho:.3f}")
+    print(f"p-value     = {p_val_corr:.6f}")
+
+    # -------------------------
+    # Interpretation for slide
+    # -------------------------
+    print("\n--------------------------------------")
+    print("           INTERPRETATION             ")
+    print("--------------------------------------\n")
+
+    if p_val_t < 0.05:
+        print("✔ Low-green areas are significantly hotter than high-green areas.")
+    else:
+        print("✖ Temperature difference between low and high green areas is NOT statistically significant.")
+
+    if p_val_corr < 0.05:
+        trend = "negative" if rho < 0 else "positive"
+        print(f"✔ Significant {trend} correlation: green coverage relates to temperature.")
+    else:
+        print("✖ No statistically significant correlation between green coverage and temperature.")
+
+    print("\n--------------------------------------")
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+gpd = pytest.importorskip("geopandas")
+shapely = pytest.importorskip("shapely")
+
+from shapely.geometry import MultiPolygon, Polygon, box
+
+from berlin_heat_analysis import areas
+from berlin_heat_analysis.area_store import AreaStore
+from berlin_heat_analysis.areas import add_green_coverage, compute_green_coverage
+
+X0, Y0 = 390000.0, 5810000.0
+
+
+def _areas():
+    # Mixed Polygon / MultiPolygon, one with a hole
+    square = box(X0, Y0, X0 + 100, Y0 + 100)
+    holed = Polygon(box(X0 + 200, Y0, X0 + 300, Y0 + 100).exterior.coords,
+                    [box(X0 + 240, Y0 + 40, X0 + 260, Y0 + 60).exterior.coords])
+    multi = MultiPolygon([box(X0, Y0 + 200, X0 + 50, Y0 + 250), box(X0 + 100, Y0 + 200, X0 + 150, Y0 + 250)])
+    return gpd.GeoDataFrame(
+        {"area": ["Mitte", "Lochpark", "Zweiteil"], "population": [100, 2000, 30]},
+        geometry=[square, holed, multi],
+        crs="EPSG:32633",
+    )
+
+
+def test_round_trip_through_memory_map(tmp_path):
+    gdf = _areas()
+    AreaStore.from_gdf(gdf).save(tmp_path)
+    store = AreaStore.open(tmp_path, mmap=True)
+
+    assert len(store) == 3
+    for epsg in (4326, 32633):
+        geom_type, coords, offsets = store.geometry[epsg]
+        assert shapely.GeometryType(geom_type) == shapely.GeometryType.MULTIPOLYGON
+        assert isinstance(coords, np.memmap) and not coords.flags.writeable
+
+    expected = np.asarray(gdf.geometry.values)
+    assert shapely.equals(store.geometries(32633), expected).all()
+    assert shapely.equals(store.geometries(4326), np.asarray(gdf.to_crs(4326).geometry.values)).all()
+
+    assert store["area"].dtype.kind == "U"
+    assert isinstance(store["area"], np.memmap) and not store["area"].flags.writeable
+    assert np.array_equal(store["area"], gdf["area"].to_numpy(dtype=str))
+    assert np.array_equal(store["population"], gdf["population"].to_numpy())
+
+
+def test_geometries_slice_matches_full(tmp_path):
+    store = AreaStore.from_gdf(_areas()).save(tmp_path)
+    full = store.geometries(32633)
+
+    for start, stop in [(0, 1), (1, 3), (2, 3), (0, 3)]:
+        assert shapely.equals(store.geometries(32633, start, stop), full[start:stop]).all()
+
+
+def test_missing_names_are_rejected():
+    gdf = _areas()
+    gdf.loc[1, "area"] = None
+    with pytest.raises(ValueError, match="missing values"):
+        AreaStore.from_gdf(gdf)
+
+
+def test_parallel_green_coverage_matches_serial(tmp_path):
+    gdf_green = gpd.GeoDataFrame(
+        geometry=[box(X0, Y0, X0 + 50, Y0 + 100), box(X0 + 250, Y0, X0 + 300, Y0 + 100),
+                  box(X0 + 100, Y0 + 200, X0 + 125, Y0 + 250)],
+        crs="EPSG:32633",
+    )
+    store = AreaStore.from_gdf(_areas()).save(tmp_path / "areas")
+    green_store = AreaStore.from_gdf(gdf_green, epsgs=(32633,)).save(tmp_path / "green")
+
+    serial = compute_green_coverage(store, green_store)["green_area"].copy()
+    parallel = compute_green_coverage(store, green_store, processes=2)["green_area"]
+
+    # Second area: 50 x 100 green strip minus the 10 x 20 part over its hole
+    np.testing.assert_allclose(serial, [0.5, 4800 / 9600, 1250 / 5000])
+    np.testing.assert_allclose(parallel, serial)
+
+
+def test_interrupted_resave_keeps_old_store(tmp_path, monkeypatch):
+    path = tmp_path / "store"
+    AreaStore.from_gdf(_areas()).save(path)
+    shorter = AreaStore.from_gdf(_areas().iloc[:2])
+
+    real_save = np.save
+    calls = []
+
+    def interrupted_save(*args, **kwargs):
+        calls.append(args[0])
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        return real_save(*args, **kwargs)
+
+    monkeypatch.setattr(np, "save", interrupted_save)
+    with pytest.raises(KeyboardInterrupt):
+        shorter.save(path)
+    monkeypatch.undo()
+
+    store = AreaStore.open(path)
+    assert len(store) == 3
+    assert shapely.equals(store.geometries(32633), np.asarray(_areas().geometry.values)).all()
+    assert np.array_equal(store["area"], ["Mitte", "Lochpark", "Zweiteil"])
+    assert os.listdir(tmp_path) == ["store"]
+
+    # An uninterrupted re-save replaces the store completely
+    shorter.save(path)
+    store = AreaStore.open(path)
+    assert len(store) == 2
+    assert np.array_equal(store["area"], ["Mitte", "Lochpark"])
+    assert os.listdir(tmp_path) == ["store"]
+
+
+def test_no_green_areas_gives_zero_coverage(monkeypatch):
+    monkeypatch.setattr(areas, "load_green_areas",
+                        lambda: gpd.GeoDataFrame(geometry=[], crs="EPSG:32633"))
+    store = AreaStore.from_gdf(_areas())
+
+    add_green_coverage(store, processes=2)
+    np.testing.assert_array_equal(store["green_area"], [0.0, 0.0, 0.0])
@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from berlin_heat_analysis.cli import HEAVY_MODULES, IMPORT_BUDGET_S, RUN_BUDGET_S
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STAGE_MODULES = [
+    "areas",
+    "area_store",
+    "berlin_heatmap",
+    "berlin_temperature_map",
+    "berlin_tree_priority_map",
+    "charts",
+    "green_coverage",
+    "ndvi_coverage",
+    "statistics",
+    "yearly_map_generator",
+]
+
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module("berlin_heat_analysis.cli")
+for name in {modules!r}:
+    importlib.import_module("berlin_heat_analysis." + name)
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def test_import_is_lazy_and_within_budget():
+    script = IMPORT_SCRIPT.format(modules=STAGE_MODULES, heavy=HEAVY_MODULES)
+    # Warm-up run writes the .pyc files so the measured run excludes compilation
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True)
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+
+    result = json.loads(out)
+    assert result["heavy"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_S
+
+
+def test_stats_on_cached_csvs_within_budget():
+    pytest.importorskip("pandas")
+    pytest.importorskip("scipy")
+
+    command = [sys.executable, "-m", "berlin_heat_analysis", "--timings", "stats"]
+    # Warm-up run writes the .pyc files and fills the OS file cache
+    subprocess.run(command, cwd=ROOT, capture_output=True)
+
+    # Wall-clock time of the whole process: interpreter startup, CLI import and the run
+    start = time.perf_counter()
+    proc = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert "over budget" not in proc.stdout
+    assert elapsed < RUN_BUDGET_S["stats"], f"stats took {elapsed:.2f} s"
@@ -0,0 +1,88 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+gpd = pytest.importorskip("geopandas")
+rasterio = pytest.importorskip("rasterio")
+
+from rasterio.transform import from_origin
+from shapely.geometry import box
+
+from berlin_heat_analysis.area_store import AreaStore
+from berlin_heat_analysis.ndvi_coverage import compute_ndvi_coverage
+
+# 6 x 12 raster of 10 m pixels in UTM 33N
+X0, Y0, RES = 400000.0, 5800060.0, 10.0
+NODATA = -9999
+SCALE = 0.0001
+
+
+def _pixel_box(col0, row0, col1, row1):
+    return box(X0 + col0 * RES, Y0 - row1 * RES, X0 + col1 * RES, Y0 - row0 * RES)
+
+
+def _store(boxes):
+    gdf = gpd.GeoDataFrame({"area": [name for name, _ in boxes]},
+                           geometry=[geom for _, geom in boxes], crs="EPSG:32633")
+    return AreaStore.from_gdf(gdf)
+
+
+@pytest.fixture
+def ndvi_raster(tmp_path):
+    ndvi = np.zeros((6, 12))
+    # Area A (cols 0-3): 0.5 in rows 0-2, 0.1 in rows 3-5, 2x2 nodata block top-left
+    ndvi[0:3, 0:4] = 0.5
+    ndvi[3:6, 0:4] = 0.1
+    # Area B (cols 4-7): 0.2, except col 7 at 0.8
+    ndvi[:, 4:8] = 0.2
+    ndvi[:, 7] = 0.8
+
+    data = np.round(ndvi / SCALE).astype("int16")
+    data[0:2, 0:2] = NODATA
+    # Area C (cols 8-11): nodata only
+    data[:, 8:12] = NODATA
+
+    path = tmp_path / "ndvi.tif"
+    with rasterio.open(
+        path, "w", driver="GTiff", width=12, height=6, count=1, dtype="int16",
+        crs="EPSG:32633", transform=from_origin(X0, Y0, RES, RES), nodata=NODATA,
+    ) as dst:
+        dst.write(data, 1)
+        dst.scales = (SCALE,)
+    return path
+
+
+def test_vegetation_fraction_and_mean_ndvi(ndvi_raster, capsys):
+    store = _store([
+        ("A", _pixel_box(0, 0, 4, 6)),
+        ("B", _pixel_box(4, 0, 8, 6)),
+        ("C", _pixel_box(8, 0, 12, 6)),
+    ])
+    compute_ndvi_coverage(store, ndvi_raster, threshold=0.3, strip_rows=4)
+
+    # A: 20 valid pixels, 8 at 0.5 and 12 at 0.1; B: 24 pixels, 6 at 0.8 and 18 at 0.2
+    np.testing.assert_allclose(store["green_area"][:2], [8 / 20, 6 / 24])
+    np.testing.assert_allclose(store["mean_ndvi"][:2], [(8 * 0.5 + 12 * 0.1) / 20, (6 * 0.8 + 18 * 0.2) / 24])
+
+    # C has no valid pixels: missing, not 0% green
+    assert np.isnan(store["green_area"][2])
+    assert np.isnan(store["mean_ndvi"][2])
+    assert "No valid NDVI pixels" in capsys.readouterr().out
+
+
+def test_raster_not_covering_areas(ndvi_raster):
+    store = _store([("far away", _pixel_box(100, 0, 104, 6))])
+    with pytest.raises(ValueError, match="does not cover"):
+        compute_ndvi_coverage(store, ndvi_raster)
+
+
+def test_raster_without_crs(tmp_path):
+    path = tmp_path / "no_crs.tif"
+    with rasterio.open(
+        path, "w", driver="GTiff", width=4, height=4, count=1, dtype="int16",
+        transform=from_origin(X0, Y0, RES, RES),
+    ) as dst:
+        dst.write(np.zeros((4, 4), dtype="int16"), 1)
+
+    store = _store([("A", _pixel_box(0, 0, 4, 4))])
+    with pytest.raises(ValueError, match="has no CRS"):
+        compute_ndvi_coverage(store, path)
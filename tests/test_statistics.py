@@ -0,0 +1,35 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+scipy_stats = pytest.importorskip("scipy.stats")
+
+from berlin_heat_analysis.config import GREEN_COVERAGE_CSV, TEMP_BY_AREA_CSV
+from berlin_heat_analysis.statistics import compute_statistics, load_merged
+
+
+def test_matches_scipy_stats_on_cached_csvs():
+    df = load_merged(TEMP_BY_AREA_CSV, GREEN_COVERAGE_CSV)
+    results = compute_statistics(df)
+
+    median_green = df["green_area"].median()
+    low = df[df["green_area"] < median_green]["mean_temp_c"]
+    high = df[df["green_area"] >= median_green]["mean_temp_c"]
+    t_stat, p_val_t = scipy_stats.ttest_ind(low, high, equal_var=False)
+    rho, p_val_corr = scipy_stats.spearmanr(df["green_area"], df["mean_temp_c"])
+
+    assert results["t_stat"] == pytest.approx(t_stat)
+    assert results["p_val_t"] == pytest.approx(p_val_t)
+    assert results["rho"] == pytest.approx(rho)
+    assert results["p_val_corr"] == pytest.approx(p_val_corr)
+
+
+def test_ties_use_average_ranks():
+    df = pd.DataFrame({
+        "green_area": [0.1, 0.1, 0.2, 0.3, 0.3, 0.4, 0.5],
+        "mean_temp_c": [30.0, 29.0, 29.0, 28.5, 27.0, 27.0, 26.0],
+    })
+    results = compute_statistics(df)
+    rho, p_val_corr = scipy_stats.spearmanr(df["green_area"], df["mean_temp_c"])
+
+    assert results["rho"] == pytest.approx(rho)
+    assert results["p_val_corr"] == pytest.approx(p_val_corr)